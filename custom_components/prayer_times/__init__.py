@@ -77,10 +77,4 @@ async def async_unload_entry(
     hass: HomeAssistant, config_entry: IslamicPrayerTimesConfigEntry
 ) -> bool:
     """Unload Islamic Prayer entry from config_entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
-    ):
-        coordinator = config_entry.runtime_data
-        if coordinator.event_unsub:
-            coordinator.event_unsub()
-    return unload_ok
\ No newline at end of file
+    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
\ No newline at end of file
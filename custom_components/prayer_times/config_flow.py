@@ -12,6 +12,9 @@
 
 from .const import DOMAIN, NAME
 
+_NAME_SELECTOR = TextSelector()
+_LOCATION_SELECTOR = LocationSelector()
+
 
 class IslamicPrayerFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle the Islamic Prayer config flow."""
@@ -46,10 +49,10 @@ async def async_step_user(
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_NAME, default=NAME): TextSelector(),
+                    vol.Optional(CONF_NAME, default=NAME): _NAME_SELECTOR,
                     vol.Required(
                         CONF_LOCATION, default=home_location
-                    ): LocationSelector(),
+                    ): _LOCATION_SELECTOR,
                 }
             ),
         )
\ No newline at end of file
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
 import logging
-from typing import Any
-import os
+from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import sqlite3
@@ -19,8 +19,76 @@
 
 _LOGGER = logging.getLogger(__name__)
 
+_DB_PATH = Path(__file__).with_name("prayertimes.db")
+
 type IslamicPrayerTimesConfigEntry = ConfigEntry[IslamicPrayerDataUpdateCoordinator]
 
+_PRAYERS = ("Fajr", "Sunrise", "Dhuhr", "Sunset", "Maghrib", "Midnight")
+_MIDNIGHT = _PRAYERS.index("Midnight")
+
+# One column per prayer, indexed by month * 32 + day; unused slots hold ""
+type _PrayerTimesTable = tuple[list[str], ...]
+_TABLE_SIZE = 13 * 32
+
+
+@lru_cache(maxsize=1440)
+def _parse_time(time_str: str) -> time:
+    """Parse a time string like '05:31', memoized per distinct string."""
+    hour, minute = time_str.split(":")
+    return time(int(hour), int(minute))
+
+
+@lru_cache(maxsize=8)
+def _standard_offset(time_zone: tzinfo, year: int) -> timedelta:
+    """Return the zone's standard (non-summer) UTC offset for the year.
+
+    Taken as the smaller of the January and July offsets rather than from
+    dst(), which holds in both hemispheres and for zones such as Europe/Dublin
+    whose tz data models winter time as a negative DST.
+    """
+    return min(
+        datetime(year, 1, 1, tzinfo=time_zone).utcoffset() or timedelta(),
+        datetime(year, 7, 1, tzinfo=time_zone).utcoffset() or timedelta(),
+    )
+
+
+def _time_to_dt(time_zone: tzinfo, time_str: str, for_date: date) -> datetime:
+    """Convert time string like '05:31' to a UTC datetime.
+
+    The table holds standard time all year round, so the zone's standard offset
+    is applied and any summer time in effect has no bearing on the instant.
+    """
+    local_dt = datetime.combine(for_date, _parse_time(time_str))
+    offset = _standard_offset(time_zone, for_date.year)
+    return local_dt.replace(tzinfo=timezone(offset)).astimezone(dt_util.UTC)
+
+
+def _get_key(table: _PrayerTimesTable, for_date: date) -> int:
+    """Return the table index for the specified date."""
+    key = for_date.month * 32 + for_date.day
+    if not table[_MIDNIGHT][key]:
+        raise UpdateFailed(f"No prayer times found in database for date: {for_date}")
+    return key
+
+
+def _lookup_midnight(table: _PrayerTimesTable, for_date: date) -> datetime:
+    """Look up only the Islamic midnight for the specified date."""
+    key = _get_key(table, for_date)
+    return _time_to_dt(dt_util.get_default_time_zone(), table[_MIDNIGHT][key], for_date)
+
+
+def _lookup_prayer_times(
+    table: _PrayerTimesTable, for_date: date
+) -> dict[str, datetime]:
+    """Look up prayer times for the specified date in the loaded table."""
+    key = _get_key(table, for_date)
+    time_zone = dt_util.get_default_time_zone()
+    # Return in the same format as PrayerTimesCalculator
+    return {
+        prayer: _time_to_dt(time_zone, column[key], for_date)
+        for prayer, column in zip(_PRAYERS, table, strict=True)
+    }
+
 
 class IslamicPrayerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, datetime]]):
     """Islamic Prayer Client Object."""
@@ -40,66 +108,50 @@ def __init__(
         self.latitude = config_entry.data[CONF_LATITUDE]
         self.longitude = config_entry.data[CONF_LONGITUDE]
         self.event_unsub: CALLBACK_TYPE | None = None
-        self.db_path = os.path.join(os.path.dirname(__file__), "prayertimes.db")
+        self.db_path = _DB_PATH
+        self._table: _PrayerTimesTable | None = None
 
-    def _fetch_prayer_times_from_db(self, for_date: date) -> dict[str, Any]:
-        """Fetch prayer times from database (runs in executor)."""
-        _LOGGER.debug("fetching prayer times")
+    def _load_prayer_times_table(self) -> _PrayerTimesTable:
+        """Load every row of the prayer times table (runs in executor)."""
+        _LOGGER.debug("loading prayer times table")
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            query = """
-            SELECT fajr, sunrise, dhuhr, sunset, maghrib, midnight
-            FROM times
-            WHERE month = ? AND day = ?
-            """
-        
-            cursor.execute(query, (for_date.month, for_date.day))
-            row = cursor.fetchone()
-            conn.close()
-            
-            if not row:
-                raise UpdateFailed(
-                    f"No prayer times found in database for date: {for_date}"
+            # The database is a static asset shipped with the integration, so
+            # open it read-only and immutable to skip locking and change checks.
+            conn = sqlite3.connect(
+                f"{self.db_path.as_uri()}?mode=ro&immutable=1", uri=True
+            )
+            try:
+                cursor = conn.execute(
+                    """
+                    SELECT month, day, fajr, sunrise, dhuhr, sunset, maghrib, midnight
+                    FROM times
+                    """
                 )
+                table = tuple([""] * _TABLE_SIZE for _ in _PRAYERS)
+                for month, day, *times in cursor.fetchall():
+                    for column, time_str in zip(table, times, strict=True):
+                        column[month * 32 + day] = time_str
+                return table
+            finally:
+                conn.close()
+        except sqlite3.Error as err:
+            raise UpdateFailed(f"Failed to load prayer times: {err}") from err
+
+    async def _async_get_table(self) -> _PrayerTimesTable:
+        """Return the prayer times table, loading it on first use.
+
+        The table has at most 366 small rows, so it is read from the SQLite
+        database once and every later refresh is an in-memory lookup.
+        """
+        if self._table is None:
+            self._table = await self.hass.async_add_executor_job(
+                self._load_prayer_times_table
+            )
+        return self._table
 
-            # Convert time strings to ISO8601 datetimes
-            def time_to_iso8601(time_str: str, for_date: date) -> str:
-                """Convert time string like '05:31' to ISO8601 datetime string."""
-                hour, minute = time_str.split(":")
-                local_dt = datetime.combine(
-                    for_date, 
-                    datetime.strptime(f"{hour}:{minute}", "%H:%M").time()
-                )
-                # Make it timezone-aware using local timezone
-                aware_dt = dt_util.as_local(local_dt)
-
-                # Adjust for DST if active
-                if aware_dt.dst():
-                    aware_dt = aware_dt + timedelta(hours=1)
-
-                return aware_dt.isoformat()
-            
-
-            # Return in the same format as PrayerTimesCalculator
-            return {
-                "Fajr": time_to_iso8601(row[0], for_date),
-                "Sunrise": time_to_iso8601(row[1], for_date),
-                "Dhuhr": time_to_iso8601(row[2], for_date),
-                "Sunset": time_to_iso8601(row[3], for_date),
-                "Maghrib": time_to_iso8601(row[4], for_date),
-                "Midnight": time_to_iso8601(row[5], for_date),
-            }
-        except Exception as err:
-            _LOGGER.error("Error fetching prayer times from database: %s", err)
-            raise UpdateFailed(f"Failed to fetch prayer times: {err}") from err
-
-    async def get_new_prayer_times(self, for_date: date) -> dict[str, Any]:
-        """Fetch prayer times for the specified date from SQLite database."""
-        return await self.hass.async_add_executor_job(
-            self._fetch_prayer_times_from_db, for_date
-        )
+    async def get_new_prayer_times(self, for_date: date) -> dict[str, datetime]:
+        """Fetch prayer times for the specified date."""
+        return _lookup_prayer_times(await self._async_get_table(), for_date)
 
     @callback
     def async_schedule_future_update(self, midnight_dt: datetime) -> None:
@@ -111,27 +163,35 @@ def async_schedule_future_update(self, midnight_dt: datetime) -> None:
         and thus we will switch to the next day's timings at Islamic midnight.
 
         The +1s is to ensure that any automations predicated on the arrival of Islamic midnight will run.
-
+        A point-in-time listener is used rather than update_interval: it fires on the wall clock even
+        when polling is disabled for the entry, and never before midnight_dt + 1s.
         """
-        _LOGGER.debug(f"Scheduling next update for Islamic prayer times for ${midnight_dt}")
-
-        # now = dt_util.now()
-        # next_midnight = (now + timedelta(days=1)).replace(
-        #     hour=0, minute=0, second=0, microsecond=0
-        # )
-        
-        # self.event_unsub = async_track_point_in_time(
-        #     self.hass, self.async_request_update, next_midnight
-        # )
-
-        self.event_unsub = async_track_point_in_time(
+        _LOGGER.debug(
+            "Scheduling next update for Islamic prayer times for %s", midnight_dt
+        )
+
+        # Refreshes can also run off-schedule (reload, manual refresh), so drop
+        # any listener still pending to keep at most one scheduled update.
+        if self.event_unsub is not None:
+            self.event_unsub()
+            self.event_unsub = None
+
+        self.event_unsub = async_track_point_in_utc_time(
             self.hass, self.async_request_update, midnight_dt + timedelta(seconds=1)
         )
 
     async def async_request_update(self, _: datetime) -> None:
         """Request update from coordinator."""
+        self.event_unsub = None
         await self.async_request_refresh()
 
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled midnight update and any pending refresh."""
+        if self.event_unsub:
+            self.event_unsub()
+            self.event_unsub = None
+        await super().async_shutdown()
+
     async def _async_update_data(self) -> dict[str, datetime]:
         """Update sensors with new prayer times.
 
@@ -140,37 +200,23 @@ async def _async_update_data(self) -> dict[str, datetime]:
         It is similarly possible (albeit less likely) that Fajr occurs before 00:00.
 
         As such, to ensure that no prayer times are "unreachable" (e.g. we always see the Isha timestamp pass before loading the next day's times),
-        we calculate 3 days' worth of times (-1, 0, +1 days) and select the appropriate set based on Islamic midnight.
+        we keep a day's times until its Islamic midnight has passed and only then switch to the next day's.
 
-        The calculation is inexpensive, so there is no need to cache it.
+        Every midnight in the bundled table falls between 23:07 and 23:45 standard time. In winter yesterday's
+        midnight has therefore always passed by 00:00, but under DST it lands up to 00:45 on today's local date,
+        so yesterday's midnight still has to be checked.
         """
 
         # Zero out the us component to maintain consistent rollover at T+1s
         now = dt_util.now().replace(microsecond=0)
-        yesterday_times = await self.get_new_prayer_times((now - timedelta(days=1)).date())
-        today_times = await self.get_new_prayer_times(now.date())
-        tomorrow_times = await self.get_new_prayer_times((now + timedelta(days=1)).date())
-
-        if (
-            yesterday_midnight := dt_util.parse_datetime(yesterday_times["Midnight"])
-        ) and now <= yesterday_midnight:
-            prayer_times = yesterday_times
-        elif (
-            tomorrow_midnight := dt_util.parse_datetime(today_times["Midnight"])
-        ) and now > tomorrow_midnight:
-            prayer_times = tomorrow_times
-        else:
-            prayer_times = today_times
-
-        # prayer_times = today_times
-
-        # # introduced in prayer-times-calculator 0.0.8
-        # prayer_times.pop("date", None)
-
-        prayer_times_info: dict[str, datetime] = {}
-        for prayer, time in prayer_times.items():
-            if prayer_time := dt_util.parse_datetime(time):
-                prayer_times_info[prayer] = dt_util.as_utc(prayer_time)
+        table = await self._async_get_table()
+        # Only resolve midnights to pick the day, then build that day alone
+        for_date = now.date()
+        if now <= _lookup_midnight(table, for_date - timedelta(days=1)):
+            for_date -= timedelta(days=1)
+        elif now > _lookup_midnight(table, for_date):
+            for_date += timedelta(days=1)
+        prayer_times_info = _lookup_prayer_times(table, for_date)
 
         self.async_schedule_future_update(prayer_times_info["Midnight"])
         return prayer_times_info
\ No newline at end of file
@@ -0,0 +1 @@
+"""Tests for the Prayer Times integration."""
@@ -0,0 +1,46 @@
+"""Fixtures for Prayer Times tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.prayer_times.const import DOMAIN
+from custom_components.prayer_times.coordinator import IslamicPrayerDataUpdateCoordinator
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+
+# The bundled table matches Toronto's sunrise and sunset in standard time
+REFERENCE_TIME_ZONE = "America/Toronto"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading custom integrations in all tests."""
+    return
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a Prayer Times config entry added to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_LATITUDE: 43.65, CONF_LONGITUDE: -79.38},
+        version=1,
+        minor_version=2,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> AsyncGenerator[IslamicPrayerDataUpdateCoordinator]:
+    """Return a coordinator in the reference time zone of the bundled table."""
+    await hass.config.async_set_time_zone(REFERENCE_TIME_ZONE)
+    coordinator = IslamicPrayerDataUpdateCoordinator(hass, config_entry)
+    yield coordinator
+    await coordinator.async_shutdown()
@@ -0,0 +1,120 @@
+"""Tests for the Prayer Times coordinator."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from custom_components.prayer_times.coordinator import IslamicPrayerDataUpdateCoordinator, _time_to_dt
+from homeassistant.util import dt as dt_util
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("time_zone", "time_str", "for_date", "expected"),
+    [
+        # Winter: standard time is in effect, so the table time is the clock time
+        (
+            "America/Toronto",
+            "12:23",
+            date(2026, 1, 1),
+            datetime(2026, 1, 1, 17, 23, tzinfo=UTC),
+        ),
+        # Summer: the same standard-time value lands an hour later on the clock
+        (
+            "America/Toronto",
+            "12:23",
+            date(2026, 7, 1),
+            datetime(2026, 7, 1, 17, 23, tzinfo=UTC),
+        ),
+        # DST starts at 02:00 on 2026-03-08: times either side keep EST
+        (
+            "America/Toronto",
+            "1:30",
+            date(2026, 3, 8),
+            datetime(2026, 3, 8, 6, 30, tzinfo=UTC),
+        ),
+        (
+            "America/Toronto",
+            "23:41",
+            date(2026, 3, 8),
+            datetime(2026, 3, 9, 4, 41, tzinfo=UTC),
+        ),
+        # Lord Howe Island shifts by 30 minutes in its (southern) summer
+        (
+            "Australia/Lord_Howe",
+            "12:23",
+            date(2026, 1, 1),
+            datetime(2026, 1, 1, 1, 53, tzinfo=UTC),
+        ),
+        # Dublin's tz data models winter as a negative DST; GMT is still standard
+        (
+            "Europe/Dublin",
+            "12:23",
+            date(2026, 1, 1),
+            datetime(2026, 1, 1, 12, 23, tzinfo=UTC),
+        ),
+        (
+            "Europe/Dublin",
+            "12:23",
+            date(2026, 7, 1),
+            datetime(2026, 7, 1, 12, 23, tzinfo=UTC),
+        ),
+    ],
+)
+def test_time_to_dt_applies_standard_offset(time_zone: str, time_str: str, for_date: date, expected: datetime) -> None:
+    """Table times are standard time all year, whatever DST the zone observes."""
+    assert _time_to_dt(dt_util.get_time_zone(time_zone), time_str, for_date) == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("now", "expected_midnight"),
+    [
+        # Before today's Islamic midnight (23:37 EST): keep today's times
+        (
+            "2026-01-15 23:00:00-05:00",
+            datetime(2026, 1, 16, 4, 37, tzinfo=UTC),
+        ),
+        # One second after today's midnight: switch to tomorrow's (23:38 EST)
+        (
+            "2026-01-15 23:37:01-05:00",
+            datetime(2026, 1, 17, 4, 38, tzinfo=UTC),
+        ),
+        # Exactly at midnight the day has not rolled over yet
+        (
+            "2026-01-15 23:37:00-05:00",
+            datetime(2026, 1, 16, 4, 37, tzinfo=UTC),
+        ),
+        # Across the year boundary: Dec 31's midnight has passed, load Jan 1
+        (
+            "2026-12-31 23:30:01-05:00",
+            datetime(2027, 1, 2, 4, 30, tzinfo=UTC),
+        ),
+        (
+            "2027-01-01 00:10:00-05:00",
+            datetime(2027, 1, 2, 4, 30, tzinfo=UTC),
+        ),
+        # Under DST yesterday's midnight (23:11 EST) is 00:11 EDT today
+        (
+            "2026-07-02 00:05:00-04:00",
+            datetime(2026, 7, 2, 4, 11, tzinfo=UTC),
+        ),
+    ],
+)
+async def test_update_selects_day_by_islamic_midnight(
+    coordinator: IslamicPrayerDataUpdateCoordinator,
+    freezer: FrozenDateTimeFactory,
+    now: str,
+    expected_midnight: datetime,
+) -> None:
+    """The active day only rolls over once its Islamic midnight has passed."""
+    freezer.move_to(now)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data["Midnight"] == expected_midnight
+    assert coordinator.event_unsub is not None